@@ -1,14 +1,50 @@
+import os
+import shutil
+
 import requests
+import urllib3
+
+SESSION = requests.Session()
 
 def download_weather_data():
     url = "https://www1.ncdc.noaa.gov/pub/data/ghcn/daily/ghcnd-stations.txt"
-    response = requests.get(url)
-    if response.status_code == 200:
-        with open("weather_data.txt", "wb") as file:
-            file.write(response.content)
-        print("Wetterdaten erfolgreich heruntergeladen.")
-    else:
-        print("Fehler beim Herunterladen der Daten:", response.status_code)
+    file_path = "weather_data.txt"
+    meta_path = file_path + ".meta"
+    headers = {}
+    if os.path.exists(file_path) and os.path.exists(meta_path):
+        # Nur erneut herunterladen, wenn sich die Datei auf dem Server geändert hat
+        with open(meta_path, "r", encoding="utf-8") as meta:
+            headers["If-Modified-Since"] = meta.read().strip()
+    try:
+        with SESSION.get(url, headers=headers, timeout=20, stream=True) as response:
+            if response.status_code == 304:
+                print("Wetterdaten sind bereits aktuell.")
+            elif response.status_code == 200:
+                # Rohdaten in 64-KB-Blöcken schreiben, statt die ganze Datei im Speicher zu halten
+                response.raw.decode_content = True
+                # Erst in eine temporäre Datei schreiben, damit ein Abbruch die alte Datei nicht zerstört
+                part_path = file_path + ".part"
+                try:
+                    with open(part_path, "wb") as file:
+                        shutil.copyfileobj(response.raw, file, 1 << 16)
+                    os.replace(part_path, file_path)
+                except BaseException:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    raise
+                # Last-Modified des Servers erst nach vollständigem Schreiben merken
+                last_modified = response.headers.get("Last-Modified")
+                if last_modified:
+                    with open(meta_path, "w", encoding="utf-8") as meta:
+                        meta.write(last_modified)
+                elif os.path.exists(meta_path):
+                    os.remove(meta_path)
+                print("Wetterdaten erfolgreich heruntergeladen.")
+            else:
+                print("Fehler beim Herunterladen der Daten:", response.status_code)
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as error:
+        # Abbrüche beim Lesen von response.raw kommen als urllib3-Fehler an
+        print("Fehler beim Herunterladen der Daten:", error)
 
 if __name__ == "__main__":
     download_weather_data()
\ No newline at end of file